@@ -9,7 +9,7 @@ from typing import Any, Callable
 
 from rich.console import Console
 
-from .claude_runner import ClaudeRunner, ClaudeRunnerError
+from .claude_runner import ClaudeRunner, ClaudeRunnerError, TokenUsage
 from .context import WorldContext
 from .tools import SLIMA_MCP_TOOLS
 
@@ -30,6 +30,7 @@ class AgentResult:
         cost_usd: float = 0.0,
         duration_s: float = 0.0,
         session_id: str = "",
+        usage: TokenUsage | None = None,
     ):
         self.summary = summary
         self.full_output = full_output
@@ -39,6 +40,7 @@ class AgentResult:
         self.cost_usd = cost_usd
         self.duration_s = duration_s
         self.session_id = session_id
+        self.usage = usage or TokenUsage()
 
     def __repr__(self) -> str:
         return (
@@ -113,10 +115,18 @@ class BaseAgent(ABC):
             )
             duration = time.time() - t0
 
+            usage = output.usage
             logger.info(
                 f"[{self.name}] Done ({len(output.text)} chars, "
                 f"{output.num_turns} turns, ${output.cost_usd:.4f})"
             )
+            logger.info(
+                f"[{self.name}] Tokens: input={usage.input_tokens} "
+                f"cache_write={usage.cache_creation_input_tokens} "
+                f"cache_read={usage.cache_read_input_tokens} "
+                f"output={usage.output_tokens} "
+                f"(cache hit {usage.cache_hit_ratio:.0%})"
+            )
 
             return AgentResult(
                 summary=output.text[:200],
@@ -125,6 +135,7 @@ class BaseAgent(ABC):
                 cost_usd=output.cost_usd,
                 duration_s=duration,
                 session_id=output.session_id,
+                usage=usage,
             )
 
         except ClaudeRunnerError as e:
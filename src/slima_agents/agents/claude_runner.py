@@ -6,7 +6,7 @@ import asyncio
 import json
 import logging
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Callable
 
 logger = logging.getLogger(__name__)
@@ -20,6 +20,42 @@ class ClaudeRunnerError(Exception):
     """Raised when the claude CLI subprocess fails."""
 
 
+@dataclass
+class TokenUsage:
+    """Token accounting reported in the ``usage`` block of the result event."""
+
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cache_creation_input_tokens: int = 0
+    cache_read_input_tokens: int = 0
+
+    @classmethod
+    def from_event(cls, usage: dict | None) -> TokenUsage:
+        """Build from a stream-json ``usage`` dict (missing keys count as 0)."""
+        usage = usage or {}
+        return cls(
+            input_tokens=usage.get("input_tokens") or 0,
+            output_tokens=usage.get("output_tokens") or 0,
+            cache_creation_input_tokens=usage.get("cache_creation_input_tokens") or 0,
+            cache_read_input_tokens=usage.get("cache_read_input_tokens") or 0,
+        )
+
+    @property
+    def total_input_tokens(self) -> int:
+        """All prompt tokens: uncached + cache writes + cache reads."""
+        return (
+            self.input_tokens
+            + self.cache_creation_input_tokens
+            + self.cache_read_input_tokens
+        )
+
+    @property
+    def cache_hit_ratio(self) -> float:
+        """Fraction of prompt tokens served from the prompt cache (0.0 if none)."""
+        total = self.total_input_tokens
+        return self.cache_read_input_tokens / total if total else 0.0
+
+
 @dataclass
 class RunOutput:
     """Structured output from a claude CLI run."""
@@ -29,6 +65,7 @@ class RunOutput:
     cost_usd: float = 0.0
     timed_out: bool = False
     session_id: str = ""
+    usage: TokenUsage = field(default_factory=TokenUsage)
 
 
 class ClaudeRunner:
@@ -69,7 +106,7 @@ class ClaudeRunner:
                 interrupt processing.
 
         Returns:
-            RunOutput with text, num_turns, cost_usd, and timed_out.
+            RunOutput with text, num_turns, cost_usd, timed_out and token usage.
 
         Raises:
             ClaudeRunnerError: If the subprocess fails after retries.
@@ -117,7 +154,7 @@ class ClaudeRunner:
                     limit=10 * 1024 * 1024,  # 10 MB — stream-json lines can be very large
                 )
 
-                result_text, num_turns, cost_usd, timed_out, sess_id = await _read_stream(
+                result_text, num_turns, cost_usd, timed_out, sess_id, usage = await _read_stream(
                     proc, timeout, on_event=on_event
                 )
 
@@ -154,6 +191,7 @@ class ClaudeRunner:
                     num_turns=num_turns,
                     cost_usd=cost_usd,
                     session_id=sess_id,
+                    usage=usage,
                 )
 
             except (asyncio.CancelledError, KeyboardInterrupt):
@@ -171,7 +209,7 @@ async def _read_stream(
     proc: asyncio.subprocess.Process,
     timeout: int,
     on_event: Callable[[dict], None] | None = None,
-) -> tuple[str, int, float, bool, str]:
+) -> tuple[str, int, float, bool, str, TokenUsage]:
     """Read stream-json events from the subprocess stdout.
 
     Args:
@@ -180,11 +218,12 @@ async def _read_stream(
         on_event: Optional callback invoked for each parsed event dict.
             Errors in the callback are logged but don't interrupt processing.
 
-    Returns (result_text, num_turns, cost_usd, timed_out, session_id).
+    Returns (result_text, num_turns, cost_usd, timed_out, session_id, usage).
     """
     result_text = ""
     num_turns = 0
     cost_usd = 0.0
+    usage = TokenUsage()
     last_assistant_text = ""
     session_id = ""
 
@@ -228,9 +267,12 @@ async def _read_stream(
                     result_text = event.get("result", "")
                     num_turns = event.get("num_turns", 0)
                     cost_usd = event.get("total_cost_usd", 0.0)
+                    usage = TokenUsage.from_event(event.get("usage"))
                     logger.debug(
                         f"[stream] result event: {len(result_text)} chars, "
-                        f"{num_turns} turns, ${cost_usd:.4f}"
+                        f"{num_turns} turns, ${cost_usd:.4f}, "
+                        f"cache read {usage.cache_read_input_tokens}"
+                        f"/{usage.total_input_tokens} input tokens"
                     )
                     break
 
@@ -248,7 +290,7 @@ async def _read_stream(
             await asyncio.wait_for(proc.wait(), timeout=5)
         except (asyncio.TimeoutError, ProcessLookupError, OSError):
             pass
-        return last_assistant_text or result_text, num_turns, cost_usd, True, session_id
+        return last_assistant_text or result_text, num_turns, cost_usd, True, session_id, usage
 
     # Drain remaining pipe data and ensure the process exits cleanly.
     # Without draining, the subprocess transport __del__ may raise
@@ -269,4 +311,4 @@ async def _read_stream(
     if not result_text and last_assistant_text:
         result_text = last_assistant_text
 
-    return result_text, num_turns, cost_usd, False, session_id
+    return result_text, num_turns, cost_usd, False, session_id, usage
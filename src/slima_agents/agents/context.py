@@ -105,21 +105,57 @@ class WorldContext:
 class DynamicContext:
     """In-memory shared state whose sections are defined dynamically.
 
-    Drop-in replacement for WorldContext / MysteryContext — same interface
+    Replacement for WorldContext / MysteryContext with the same method names
     (read, write, append, serialize_for_prompt, to_snapshot, from_snapshot)
     but sections are dynamic instead of hardcoded.
 
+    ``read`` / ``write`` / ``append`` are plain synchronous methods: they do
+    no I/O, so there is nothing to await and no coroutine to allocate.
+
     ``book_structure`` is always implicitly available.
+
+    No lock is held: every operation is a plain dict update, so coroutines
+    on the single event loop cannot interleave mid-update.
+
+    The rendered prompt string is memoized and only rebuilt after a
+    mutation (write, append, from_snapshot or a new ``user_prompt``).
+    Writing the content a section already holds is not a mutation.
+
+    Every mutation also bumps ``revision``, so callers can tell whether the
+    context changed since they last persisted it.
     """
 
+    __slots__ = (
+        "_allowed_sections",
+        "_allowed_set",
+        "_valid_sections_msg",
+        "_section_prefixes",
+        "_data",
+        "_user_prompt",
+        "_prompt_cache",
+        "_revision",
+    )
+
     def __init__(self, allowed_sections: list[str]) -> None:
         # Ensure book_structure is always present
-        self._allowed_sections: tuple[str, ...] = tuple(
-            dict.fromkeys([*allowed_sections, "book_structure"])
-        )
-        self._data: dict[str, str] = {}
-        self._lock = asyncio.Lock()
-        self.user_prompt: str = ""
+        self._set_sections(tuple(dict.fromkeys([*allowed_sections, "book_structure"])))
+        # Each section is a list of chunks joined with "\n" on read, so that
+        # append() is O(len(content)) rather than re-copying the whole section.
+        # A stored list always starts with a non-empty chunk.
+        self._data: dict[str, list[str]] = {}
+        self._user_prompt: str = ""
+        self._prompt_cache: str | None = None
+        self._revision: int = 0
+
+    def _set_sections(self, sections: tuple[str, ...]) -> None:
+        """Install the section list and everything derived from it."""
+        self._allowed_sections: tuple[str, ...] = sections  # render order
+        self._allowed_set: frozenset[str] = frozenset(sections)  # membership
+        self._valid_sections_msg: str = ", ".join(sections)  # error-path suffix
+        # "## Power Structures\n" — rendered once per section, not per prompt
+        self._section_prefixes: dict[str, str] = {
+            s: "## " + s.replace("_", " ").title() + "\n" for s in sections
+        }
 
     # --- Compatibility alias ---
 
@@ -127,61 +163,102 @@ class DynamicContext:
     def SECTIONS(self) -> tuple[str, ...]:
         return self._allowed_sections
 
-    # --- Core operations (same interface as WorldContext / MysteryContext) ---
+    @property
+    def user_prompt(self) -> str:
+        return self._user_prompt
+
+    @user_prompt.setter
+    def user_prompt(self, value: str) -> None:
+        self._user_prompt = value
+        self._changed()
 
-    async def read(self, section: str) -> str:
-        if section not in self._allowed_sections:
-            return f"Unknown section: {section}. Valid: {', '.join(self._allowed_sections)}"
-        async with self._lock:
-            return self._data.get(section, "")
+    @property
+    def revision(self) -> int:
+        """Monotonic counter bumped on every mutation; equal means unchanged."""
+        return self._revision
 
-    async def write(self, section: str, content: str) -> str:
-        if section not in self._allowed_sections:
-            return f"Unknown section: {section}. Valid: {', '.join(self._allowed_sections)}"
-        async with self._lock:
-            self._data[section] = content
+    def _changed(self) -> None:
+        """Record a mutation: new revision, stale prompt cache."""
+        self._revision += 1
+        self._prompt_cache = None
+
+    def _store(self, section: str, content: str) -> None:
+        """Replace a section's content (an empty string clears it)."""
+        if content:
+            self._data[section] = [content]
+        else:
+            self._data.pop(section, None)
+
+    # --- Core operations (synchronous; no I/O involved) ---
+
+    def read(self, section: str) -> str:
+        if section not in self._allowed_set:
+            return f"Unknown section: {section}. Valid: {self._valid_sections_msg}"
+        return "\n".join(self._data.get(section, ()))
+
+    def write(self, section: str, content: str) -> str:
+        if section not in self._allowed_set:
+            return f"Unknown section: {section}. Valid: {self._valid_sections_msg}"
+        # Re-writing identical content (e.g. an unchanged book_structure tree)
+        # keeps the stored string and does not count as a change.
+        if content != "\n".join(self._data.get(section, ())):
+            self._store(section, content)
+            self._changed()
         return f"Updated context section '{section}'"
 
-    async def append(self, section: str, content: str) -> str:
-        if section not in self._allowed_sections:
-            return f"Unknown section: {section}. Valid: {', '.join(self._allowed_sections)}"
-        async with self._lock:
-            current = self._data.get(section, "")
-            self._data[section] = current + "\n" + content if current else content
+    def append(self, section: str, content: str) -> str:
+        if section not in self._allowed_set:
+            return f"Unknown section: {section}. Valid: {self._valid_sections_msg}"
+        chunks = self._data.get(section)
+        if chunks:
+            chunks.append(content)
+            self._changed()
+        elif content:
+            self._data[section] = [content]
+            self._changed()
+        # else: "" onto an empty section stores nothing and is not a change
         return f"Appended to context section '{section}'"
 
     # --- Serialization ---
 
     def serialize_for_prompt(self) -> str:
         """Render all non-empty sections as a string for agent system prompts."""
-        parts: list[str] = []
-        if self.user_prompt:
-            parts.append(f"## User Request\n{self.user_prompt}")
-        for section in self._allowed_sections:
-            value = self._data.get(section, "")
-            if value:
-                header = section.replace("_", " ").title()
-                parts.append(f"## {header}\n{value}")
+        if self._prompt_cache is not None:
+            return self._prompt_cache
+        data = self._data
+        prefixes = self._section_prefixes
+        parts: list[str] = (
+            ["## User Request\n" + self._user_prompt] if self._user_prompt else []
+        )
+        parts.extend(
+            prefixes[section] + "\n".join(chunks)
+            for section in self._allowed_sections
+            if (chunks := data.get(section))
+        )
         if not parts:
-            return "(No context populated yet.)"
-        return "\n\n".join(parts)
+            rendered = "(No context populated yet.)"
+        else:
+            rendered = "\n\n".join(parts)
+        self._prompt_cache = rendered
+        return rendered
 
     def to_snapshot(self) -> dict:
         """Serialize to a JSON-safe dict for persistence."""
         data: dict = {"_allowed_sections": list(self._allowed_sections)}
-        if self.user_prompt:
-            data["user_prompt"] = self.user_prompt
+        if self._user_prompt:
+            data["user_prompt"] = self._user_prompt
         for section in self._allowed_sections:
-            value = self._data.get(section, "")
-            if value:
-                data[section] = value
+            chunks = self._data.get(section)
+            if chunks:
+                data[section] = "\n".join(chunks)
         return data
 
     def from_snapshot(self, data: dict) -> None:
         """Restore context from a snapshot dict."""
         if "_allowed_sections" in data:
-            self._allowed_sections = tuple(data["_allowed_sections"])
-        self.user_prompt = data.get("user_prompt", "")
+            self._set_sections(tuple(data["_allowed_sections"]))
+        self._user_prompt = data.get("user_prompt", "")
         for section in self._allowed_sections:
             if section in data:
-                self._data[section] = data[section]
+                self._store(section, data[section])
+        self._changed()
@@ -11,13 +11,16 @@ from .task_models import TaskPlan
 # JSON extraction
 # ---------------------------------------------------------------------------
 
+_DECODER = json.JSONDecoder()
+_JSON_FENCE_RE = re.compile(r"```json\s*\n(.*?)```", re.DOTALL)
+
 
 def extract_json_object(text: str) -> dict:
     """Extract a JSON object from *text* with a three-layer fallback.
 
     1. Direct ``json.loads`` (pure JSON string).
     2. Regex: last ```json ... ``` fenced block.
-    3. Brace-matching: last balanced ``{...}`` from the tail.
+    3. Scan: last top-level ``{...}`` embedded in surrounding text.
 
     Raises ``ValueError`` when no valid JSON object can be found.
     """
@@ -35,8 +38,7 @@ def extract_json_object(text: str) -> dict:
         pass
 
     # --- Layer 2: fenced code block (last match) ---
-    fence_pattern = re.compile(r"```json\s*\n(.*?)```", re.DOTALL)
-    matches = fence_pattern.findall(text)
+    matches = _JSON_FENCE_RE.findall(text)
     if matches:
         candidate = matches[-1].strip()
         try:
@@ -47,28 +49,22 @@ def extract_json_object(text: str) -> dict:
         except json.JSONDecodeError:
             pass
 
-    # --- Layer 3: brace-matching from tail ---
-    depth = 0
-    end = -1
-    for i in range(len(text) - 1, -1, -1):
-        ch = text[i]
-        if ch == "}":
-            if depth == 0:
-                end = i
-            depth += 1
-        elif ch == "{":
-            depth -= 1
-            if depth == 0:
-                candidate = text[i : end + 1]
-                try:
-                    obj = json.loads(candidate)
-                    if not isinstance(obj, dict):
-                        raise ValueError(
-                            f"Expected JSON object, got {type(obj).__name__}"
-                        )
-                    return obj
-                except json.JSONDecodeError:
-                    pass
+    # --- Layer 3: scan for embedded objects (last one wins) ---
+    # raw_decode parses one value starting at a "{" and reports where it
+    # ends, so braces inside JSON strings are handled and each top-level
+    # object is parsed exactly once.
+    found: dict | None = None
+    idx = text.find("{")
+    while idx != -1:
+        try:
+            obj, end = _DECODER.raw_decode(text, idx)
+        except json.JSONDecodeError:
+            idx = text.find("{", idx + 1)
+            continue
+        found = obj
+        idx = text.find("{", end)
+    if found is not None:
+        return found
 
     raise ValueError("No valid JSON object found in text")
 
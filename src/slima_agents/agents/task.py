@@ -57,6 +57,8 @@ class TaskAgent(BaseAgent):
         self._system_prompt_text = system_prompt_text
         self._tool_set = tool_set
         self._plan_first = plan_first
+        # Resolved once; unknown tool_set values fall back to read-only
+        self._allowed_tools = _TOOL_SETS.get(tool_set, _TOOL_SETS["read"])
 
     @property
     def name(self) -> str:
@@ -90,4 +92,4 @@ class TaskAgent(BaseAgent):
         return self._prompt
 
     def allowed_tools(self) -> list[str]:
-        return _TOOL_SETS.get(self._tool_set, _TOOL_SETS["read"])
+        return self._allowed_tools
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from pydantic import BaseModel, field_validator
+from pydantic import BaseModel, Field
 
 
 class TaskStageDefinition(BaseModel):
@@ -12,6 +12,9 @@ class TaskStageDefinition(BaseModel):
     Stages with the same ``number`` run in parallel (asyncio.gather).
     """
 
+    # Core schema is built on first validation, not at import
+    model_config = {"defer_build": True}
+
     number: int  # execution order (same number = parallel)
     name: str  # machine identifier
     display_name: str = ""  # human-readable (defaults to name)
@@ -36,16 +39,12 @@ class TaskPlan(BaseModel):
     If neither is set, the pipeline runs in book-less mode.
     """
 
+    model_config = {"defer_build": True}
+
     title: str = ""  # non-empty → create book
     book_token: str = ""  # non-empty → use existing book
-    stages: list[TaskStageDefinition]  # at least 1
-
-    @field_validator("stages")
-    @classmethod
-    def _at_least_one_stage(cls, v: list[TaskStageDefinition]) -> list[TaskStageDefinition]:
-        if not v:
-            raise ValueError("stages must contain at least 1 stage")
-        return v
+    # at least 1 — checked in pydantic-core and exported as minItems in the schema
+    stages: list[TaskStageDefinition] = Field(min_length=1)
 
     @property
     def context_sections(self) -> list[str]:
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import json
 import logging
 import re
@@ -36,12 +37,18 @@ class TaskOrchestrator:
         model: str | None = None,
         emitter: ProgressEmitter | None = None,
         console: Console | None = None,
+        max_parallel: int | None = None,
     ):
         self.slima = slima_client
         self.model = model
         self.context: DynamicContext | None = None
         self.emitter = emitter or ProgressEmitter(enabled=False)
         self.console = console or Console()
+        # Cap on concurrently running agents within one same-number group
+        # (None = run the whole group at once)
+        self.max_parallel = max_parallel
+        # Context revision last persisted to agent-log/context-snapshot.json
+        self._snapshot_revision: int | None = None
 
     async def run(self, plan: TaskPlan) -> str:
         """Execute a TaskPlan. Returns book_token (or "" if no book)."""
@@ -56,28 +63,32 @@ class TaskOrchestrator:
             # --- Book setup ---
             book_token = await self._setup_book(plan, book_token)
 
+            # --- Group stages by number (once; shared by everything below) ---
+            groups = self._group_stages(plan.stages)
+
             # --- Context init ---
             self.context = DynamicContext(allowed_sections=plan.context_sections)
-            await self._inject_pipeline_info(plan, book_token)
+            self._snapshot_revision = None
+            self._inject_pipeline_info(plan, book_token, groups)
 
             # --- Tracker init ---
             tracker: PipelineTracker | None = None
             if book_token:
-                tracker = self._create_tracker(plan, book_token)
+                tracker = self._create_tracker(plan, book_token, groups)
                 await tracker.start()
 
-            # --- Group stages by number ---
-            groups = self._group_stages(plan.stages)
             last_session_id = ""  # for chain_to_previous
 
-            for number in sorted(groups.keys()):
-                group = groups[number]
-
+            for number, group in groups.items():
                 if tracker:
                     await tracker.stage_start(number)
 
+                # Book tree fetched right after the group; reused for injection
+                structure: list[dict] | None
                 if len(group) == 1:
-                    result = await self._run_single_stage(group[0], book_token, last_session_id)
+                    result, structure = await self._run_single_stage(
+                        group[0], book_token, last_session_id,
+                    )
                     last_session_id = result.session_id or last_session_id
 
                     # Capture book_token from creates_book stage
@@ -85,13 +96,13 @@ class TaskOrchestrator:
                         captured = self._extract_book_token(result.full_output)
                         if captured:
                             book_token = captured
-                            await self._on_book_created(book_token, plan)
+                            await self._on_book_created(book_token, plan, groups)
                             # Init tracker now that we have a book
                             if not tracker:
-                                tracker = self._create_tracker(plan, book_token)
+                                tracker = self._create_tracker(plan, book_token, groups)
                                 await tracker.start()
                 else:
-                    results = await self._run_parallel_stages(group, book_token)
+                    results, structure = await self._run_parallel_stages(group, book_token)
                     # After parallel group, pick last non-empty session_id
                     for r in results:
                         if r.session_id:
@@ -99,7 +110,7 @@ class TaskOrchestrator:
 
                 # Post-group: inject book structure + save snapshot
                 if book_token:
-                    await self._inject_book_structure(book_token)
+                    await self._inject_book_structure(book_token, structure)
                     await self._save_context_snapshot(book_token)
 
                 if tracker:
@@ -132,7 +143,10 @@ class TaskOrchestrator:
         m = self._BOOK_TOKEN_RE.search(text)
         return m.group(0) if m else ""
 
-    async def _on_book_created(self, book_token: str, plan: TaskPlan) -> None:
+    async def _on_book_created(
+        self, book_token: str, plan: TaskPlan,
+        groups: dict[int, list[TaskStageDefinition]],
+    ) -> None:
         """Post-processing after a creates_book stage produces a book_token."""
         self.emitter.book_created(book_token, plan.title, "")
         self.console.print(f"  Book captured: [cyan]{book_token}[/cyan]")
@@ -149,7 +163,7 @@ class TaskOrchestrator:
             logger.warning(f"Failed to save task plan: {e}")
 
         # Update pipeline info with real book_token
-        await self._inject_pipeline_info(plan, book_token)
+        self._inject_pipeline_info(plan, book_token, groups)
 
     # --- Internal ---
 
@@ -185,19 +199,23 @@ class TaskOrchestrator:
 
         return book_token
 
-    def _create_tracker(self, plan: TaskPlan, book_token: str) -> PipelineTracker:
-        """Create a PipelineTracker from the plan."""
+    def _create_tracker(
+        self, plan: TaskPlan, book_token: str,
+        groups: dict[int, list[TaskStageDefinition]],
+    ) -> PipelineTracker:
+        """Create a PipelineTracker from the plan's stage groups."""
         tracker = PipelineTracker(
             pipeline_name="task-pipeline",
             book_token=book_token,
             prompt=plan.title,
             slima=self.slima,
+            # A plan-supplied token means an earlier run may have left progress.md
+            reused_book=book_token == plan.book_token,
         )
-        groups = self._group_stages(plan.stages)
-        stage_defs: list[tuple[int, str]] = []
-        for number in sorted(groups.keys()):
-            names = [s.name for s in groups[number]]
-            stage_defs.append((number, "+".join(names)))
+        stage_defs = [
+            (number, "+".join(s.name for s in group))
+            for number, group in groups.items()
+        ]
         tracker.define_stages(stage_defs)
         return tracker
 
@@ -205,17 +223,25 @@ class TaskOrchestrator:
     def _group_stages(
         stages: list[TaskStageDefinition],
     ) -> dict[int, list[TaskStageDefinition]]:
-        """Group stages by number. Same number = parallel."""
+        """Group stages by number. Same number = parallel.
+
+        Keys are in ascending stage-number order, so callers iterate
+        ``groups.items()`` directly.
+        """
         groups: dict[int, list[TaskStageDefinition]] = {}
         for s in stages:
             groups.setdefault(s.number, []).append(s)
-        return groups
+        return dict(sorted(groups.items()))
 
     async def _run_single_stage(
         self, stage_def: TaskStageDefinition, book_token: str,
         last_session_id: str = "",
-    ) -> AgentResult:
-        """Run one TaskAgent stage."""
+    ) -> tuple[AgentResult, list[dict] | None]:
+        """Run one TaskAgent stage.
+
+        Returns the agent result and the book structure fetched after it
+        (``None`` without a book or when the fetch failed).
+        """
         display = stage_def.resolved_display_name
         stage_num = stage_def.number
         agent_name = f"TaskAgent[{stage_def.name}]"
@@ -243,12 +269,7 @@ class TaskOrchestrator:
 
             try:
                 result = await agent.run()
-                self.emitter.agent_complete(
-                    stage=stage_num, agent=agent_name,
-                    duration_s=result.duration_s, timed_out=result.timed_out,
-                    summary=result.summary, num_turns=result.num_turns,
-                    cost_usd=result.cost_usd,
-                )
+                self._emit_agent_complete(stage_num, agent_name, result)
                 status_label = "[yellow]partial[/yellow]" if result.timed_out else "[green]done[/green]"
                 progress.update(task_id, description=f"[Stage {stage_num}] {display} {status_label}")
             except Exception as e:
@@ -258,9 +279,10 @@ class TaskOrchestrator:
 
         # Emit new files
         new_files: set[str] = set()
+        structure: list[dict] | None = None
         if book_token:
-            post_paths = await self._get_all_file_paths(book_token)
-            new_files = post_paths - pre_paths
+            structure = await self._get_structure(book_token)
+            new_files = set(flatten_paths(structure or [])) - pre_paths
             for new_path in sorted(new_files):
                 self.emitter.file_created(new_path)
 
@@ -269,15 +291,19 @@ class TaskOrchestrator:
         # Structured handoff: write result + metadata into context section
         if stage_def.context_section and result.full_output:
             handoff = self._build_handoff(stage_def, result, new_files)
-            await self.context.write(stage_def.context_section, handoff)
+            self.context.write(stage_def.context_section, handoff)
 
         self.console.print(f"  [green]{display}:[/green] {result.summary[:80]}")
-        return result
+        return result, structure
 
     async def _run_parallel_stages(
         self, stages: list[TaskStageDefinition], book_token: str,
-    ) -> list[AgentResult]:
-        """Run multiple stages in parallel (same number)."""
+    ) -> tuple[list[AgentResult], list[dict] | None]:
+        """Run multiple stages in parallel (same number).
+
+        Returns the successful results and the book structure fetched after
+        the group, as in ``_run_single_stage``.
+        """
         stage_num = stages[0].number
         agent_names = [f"TaskAgent[{s.name}]" for s in stages]
         phase_name = f"Stage {stage_num}"
@@ -288,6 +314,12 @@ class TaskOrchestrator:
         # Snapshot paths BEFORE
         pre_paths = await self._get_all_file_paths(book_token) if book_token else set()
 
+        # Agents render their prompt only once they get past the semaphore, so
+        # hand them a copy frozen at group start: siblings' handoffs must not
+        # leak into stages that merely queued behind them.
+        group_context = DynamicContext(allowed_sections=[])
+        group_context.from_snapshot(self.context.to_snapshot())
+
         with Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
@@ -296,21 +328,27 @@ class TaskOrchestrator:
         ) as progress:
             tasks = {}
             for s in stages:
-                tasks[s.name] = progress.add_task(f"[{phase_name}] {s.resolved_display_name}...", total=None)
+                # Timer starts when the agent does, not while it is queued
+                tasks[s.name] = progress.add_task(
+                    f"[{phase_name}] {s.resolved_display_name}...", total=None, start=False,
+                )
+
+            sem = (
+                asyncio.Semaphore(self.max_parallel)
+                if self.max_parallel and self.max_parallel < len(stages)
+                else contextlib.nullcontext()
+            )
 
             async def _run_one(stage_def: TaskStageDefinition) -> tuple[str, AgentResult]:
                 agent_name = f"TaskAgent[{stage_def.name}]"
-                agent = self._create_agent(stage_def, book_token)
+                agent = self._create_agent(stage_def, book_token, context=group_context)
                 agent.on_event = self.emitter.make_agent_callback(agent_name, stage=stage_num)
-                self.emitter.agent_start(stage_num, agent_name)
                 try:
-                    result = await agent.run()
-                    self.emitter.agent_complete(
-                        stage=stage_num, agent=agent_name,
-                        duration_s=result.duration_s, timed_out=result.timed_out,
-                        summary=result.summary, num_turns=result.num_turns,
-                        cost_usd=result.cost_usd,
-                    )
+                    async with sem:
+                        self.emitter.agent_start(stage_num, agent_name)
+                        progress.start_task(tasks[stage_def.name])
+                        result = await agent.run()
+                    self._emit_agent_complete(stage_num, agent_name, result)
                     status_label = "[yellow]partial[/yellow]" if result.timed_out else "[green]done[/green]"
                     progress.update(tasks[stage_def.name], description=f"[{phase_name}] {stage_def.resolved_display_name} {status_label}")
 
@@ -318,7 +356,7 @@ class TaskOrchestrator:
                     if stage_def.context_section and result.full_output:
                         # Note: new_files not available per-agent in parallel mode
                         handoff = self._build_handoff(stage_def, result, set())
-                        await self.context.write(stage_def.context_section, handoff)
+                        self.context.write(stage_def.context_section, handoff)
 
                     return stage_def.name, result
                 except Exception as e:
@@ -333,9 +371,10 @@ class TaskOrchestrator:
             )
 
         # Snapshot paths AFTER
+        structure: list[dict] | None = None
         if book_token:
-            post_paths = await self._get_all_file_paths(book_token)
-            for new_path in sorted(post_paths - pre_paths):
+            structure = await self._get_structure(book_token)
+            for new_path in sorted(set(flatten_paths(structure or [])) - pre_paths):
                 self.emitter.file_created(new_path)
 
         self.emitter.stage_complete(stage_num, phase_name, time.time() - stage_t0)
@@ -352,15 +391,15 @@ class TaskOrchestrator:
                 else:
                     self.console.print(f"  [green]{name}:[/green] {result.summary[:80]}")
 
-        return agent_results
+        return agent_results, structure
 
     def _create_agent(
         self, stage_def: TaskStageDefinition, book_token: str,
-        resume_session: str = "",
+        resume_session: str = "", context: DynamicContext | None = None,
     ) -> TaskAgent:
-        """Build a TaskAgent from a stage definition."""
+        """Build a TaskAgent from a stage definition (on ``self.context`` by default)."""
         return TaskAgent(
-            context=self.context,
+            context=context or self.context,
             book_token=book_token,
             model=self.model,
             timeout=stage_def.timeout,
@@ -371,20 +410,39 @@ class TaskOrchestrator:
             resume_session=resume_session,
         )
 
+    def _emit_agent_complete(self, stage_num: int, agent_name: str, result: AgentResult) -> None:
+        """Emit ``agent_complete`` including the agent's token accounting."""
+        usage = result.usage
+        self.emitter.agent_complete(
+            stage=stage_num, agent=agent_name,
+            duration_s=result.duration_s, timed_out=result.timed_out,
+            summary=result.summary, num_turns=result.num_turns,
+            cost_usd=result.cost_usd,
+            input_tokens=usage.input_tokens,
+            output_tokens=usage.output_tokens,
+            cache_creation_input_tokens=usage.cache_creation_input_tokens,
+            cache_read_input_tokens=usage.cache_read_input_tokens,
+        )
+
     # --- Context enrichment ---
 
-    async def _inject_pipeline_info(self, plan: TaskPlan, book_token: str) -> None:
+    def _inject_pipeline_info(
+        self, plan: TaskPlan, book_token: str,
+        groups: dict[int, list[TaskStageDefinition]],
+    ) -> None:
         """Inject pipeline metadata into context so all agents see the overall plan."""
-        stage_lines = []
-        for s in sorted(plan.stages, key=lambda x: x.number):
-            stage_lines.append(f"  {s.number}. {s.resolved_display_name} ({s.name})")
+        stage_lines = [
+            f"  {s.number}. {s.resolved_display_name} ({s.name})"
+            for group in groups.values()
+            for s in group
+        ]
         info = (
             f"Title: {plan.title or '(untitled)'}\n"
             f"Book: {book_token or '(no book)'}\n"
             f"Total stages: {len(plan.stages)}\n"
             f"Stage plan:\n" + "\n".join(stage_lines)
         )
-        await self.context.write("_pipeline_info", info)
+        self.context.write("_pipeline_info", info)
 
     @staticmethod
     def _build_handoff(
@@ -405,22 +463,31 @@ class TaskOrchestrator:
 
     # --- Shared helpers (same pattern as GenericOrchestrator) ---
 
-    async def _get_all_file_paths(self, book_token: str) -> set[str]:
+    async def _get_structure(self, book_token: str) -> list[dict] | None:
         try:
-            structure = await self.slima.get_book_structure(book_token)
-            return set(flatten_paths(structure))
+            return await self.slima.get_book_structure(book_token)
         except Exception:
-            return set()
+            return None
+
+    async def _get_all_file_paths(self, book_token: str) -> set[str]:
+        return set(flatten_paths(await self._get_structure(book_token) or []))
 
-    async def _inject_book_structure(self, book_token: str) -> None:
+    async def _inject_book_structure(
+        self, book_token: str, structure: list[dict] | None = None,
+    ) -> None:
+        # ``structure`` is the group's post-stage fetch; nothing writes to the
+        # book in between. Fetch afresh when there is none.
         try:
-            structure = await self.slima.get_book_structure(book_token)
+            if structure is None:
+                structure = await self.slima.get_book_structure(book_token)
             tree_str = format_structure_tree(structure)
-            await self.context.write("book_structure", tree_str)
+            self.context.write("book_structure", tree_str)
         except Exception as e:
             logger.warning(f"Failed to inject book structure: {e}")
 
     async def _save_context_snapshot(self, book_token: str) -> None:
+        if self.context.revision == self._snapshot_revision:
+            return  # nothing changed since the last upload
         try:
             snapshot = self.context.to_snapshot()
             await self.slima.write_file(
@@ -429,5 +496,6 @@ class TaskOrchestrator:
                 content=json.dumps(snapshot, ensure_ascii=False, indent=2),
                 commit_message="Update context snapshot",
             )
+            self._snapshot_revision = self.context.revision
         except Exception as e:
             logger.warning(f"Failed to save context snapshot: {e}")
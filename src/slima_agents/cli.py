@@ -242,7 +242,11 @@ def plan_build(prompt: str, model: str | None, json_progress: bool, timeout: int
 @main.command("task-pipeline")
 @click.option("--model", "-m", default=None, help="指定 Claude 模型（如 claude-opus-4-6）。")
 @click.option("--json-progress", is_flag=True, default=False, help="輸出 NDJSON 進度事件到 stdout。")
-def task_pipeline(model: str | None, json_progress: bool):
+@click.option(
+    "--max-parallel", type=click.IntRange(min=1), default=None,
+    help="同編號 stages 最多同時執行幾個 agent（預設不限）。",
+)
+def task_pipeline(model: str | None, json_progress: bool, max_parallel: int | None):
     """Front-end configurable multi-stage TaskAgent pipeline.
 
     \b
@@ -263,7 +267,6 @@ def task_pipeline(model: str | None, json_progress: bool):
         raise SystemExit(1)
 
     # Load TaskPlan from stdin
-    import json as json_mod
     from .agents.task_models import TaskPlan
 
     try:
@@ -271,8 +274,8 @@ def task_pipeline(model: str | None, json_progress: bool):
         if not raw.strip():
             cli_console.print("[red]Error:[/red] No JSON provided via stdin.")
             raise SystemExit(1)
-        data = json_mod.loads(raw)
-        task_plan = TaskPlan.model_validate(data)
+        # Parse + validate in one pydantic-core pass (no intermediate dict)
+        task_plan = TaskPlan.model_validate_json(raw)
     except SystemExit:
         raise
     except Exception as e:
@@ -287,6 +290,7 @@ def task_pipeline(model: str | None, json_progress: bool):
                 model=config.model,
                 emitter=emitter,
                 console=cli_console,
+                max_parallel=max_parallel,
             )
             return await orch.run(task_plan)
 
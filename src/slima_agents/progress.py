@@ -17,7 +17,7 @@ def _iso_now() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
-@dataclass
+@dataclass(slots=True)
 class ProgressEmitter:
     """Emits NDJSON progress events to a stream (default: stdout).
 
@@ -74,6 +74,10 @@ class ProgressEmitter:
         summary: str = "",
         num_turns: int = 0,
         cost_usd: float = 0.0,
+        input_tokens: int = 0,
+        output_tokens: int = 0,
+        cache_creation_input_tokens: int = 0,
+        cache_read_input_tokens: int = 0,
     ) -> None:
         self._emit(
             "agent_complete",
@@ -84,6 +88,10 @@ class ProgressEmitter:
             summary=summary[:200],
             num_turns=num_turns,
             cost_usd=round(cost_usd, 4),
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            cache_creation_input_tokens=cache_creation_input_tokens,
+            cache_read_input_tokens=cache_read_input_tokens,
         )
 
     # -- Data events ---------------------------------------------------------
@@ -33,6 +33,13 @@ class NotFoundError(SlimaApiError):
     pass
 
 
+# status code -> (exception class, fallback message)
+_ERRORS_BY_STATUS: dict[int, tuple[type[SlimaApiError], str | None]] = {
+    401: (AuthenticationError, "Authentication failed"),
+    404: (NotFoundError, "Not found"),
+}
+
+
 class SlimaClient:
     """Async client for Slima REST API, mirroring the TypeScript SlimaApiClient."""
 
@@ -73,11 +80,8 @@ class SlimaClient:
         except Exception:
             code, message = None, None
 
-        if resp.status_code == 401:
-            raise AuthenticationError(resp.status_code, code, message or "Authentication failed")
-        if resp.status_code == 404:
-            raise NotFoundError(resp.status_code, code, message or "Not found")
-        raise SlimaApiError(resp.status_code, code, message)
+        exc_cls, default_message = _ERRORS_BY_STATUS.get(resp.status_code, (SlimaApiError, None))
+        raise exc_cls(resp.status_code, code, message or default_message)
 
     # === Book Operations ===
 
@@ -105,10 +109,13 @@ class SlimaClient:
     # === Version Control ===
 
     async def list_commits(self, book_token: str, limit: int = 10) -> list[Commit]:
-        data = await self._request("GET", f"/api/v1/books/{book_token}/commits?limit={limit}")
-        commits = data.get("commits", data) if isinstance(data, dict) else data
+        commits = await self._list_commits_raw(book_token, limit)
         return [Commit.model_validate(c) for c in commits]
 
+    async def _list_commits_raw(self, book_token: str, limit: int) -> list[dict]:
+        data = await self._request("GET", f"/api/v1/books/{book_token}/commits?limit={limit}")
+        return data.get("commits", data) if isinstance(data, dict) else data
+
     # === MCP File Operations ===
 
     async def create_file(
@@ -198,27 +205,32 @@ class SlimaClient:
 
         The API returns a flat list with parentToken references.
         This method rebuilds the nested tree structure.
+
+        Only four fields per node are needed, so the raw snapshot dicts are
+        used directly instead of validating a full ``Commit`` model.
         """
-        commits = await self.list_commits(book_token, limit=1)
+        commits = await self._list_commits_raw(book_token, limit=1)
         if not commits:
             return []
+        snapshot: list[dict] = commits[0].get("filesSnapshot") or []
 
         # Build a lookup dict and reconstruct the tree from parentToken
         all_items = {
-            fs.token: {
-                "name": fs.name,
-                "kind": fs.kind,
-                "position": fs.position,
+            fs["token"]: {
+                "name": fs["name"],
+                "kind": fs["kind"],
+                "position": fs["position"],
                 "children": [],
             }
-            for fs in commits[0].files_snapshot
+            for fs in snapshot
         }
 
         roots: list[dict] = []
-        for fs in commits[0].files_snapshot:
-            node = all_items[fs.token]
-            if fs.parent_token and fs.parent_token in all_items:
-                all_items[fs.parent_token]["children"].append(node)
+        for fs in snapshot:
+            node = all_items[fs["token"]]
+            parent_token = fs.get("parentToken")
+            if parent_token and parent_token in all_items:
+                all_items[parent_token]["children"].append(node)
             else:
                 roots.append(node)
 
@@ -3,16 +3,36 @@
 from __future__ import annotations
 
 import logging
+import operator
 import re
+import time
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, ClassVar
 
 if TYPE_CHECKING:
     from .slima.client import SlimaClient
 
 logger = logging.getLogger(__name__)
 
+# "120.5s" in the Duration column
+_DUR_RE = re.compile(r"([\d.]+)s")
+
+_STAGES_TABLE_HEAD = (
+    "## Stages\n"
+    "\n"
+    "| # | Stage | Status | Started | Completed | Duration | Notes |\n"
+    "|---|-------|--------|---------|-----------|----------|-------|"
+)
+
+# Header bullet label -> PipelineTracker attribute
+_HEADER_FIELDS = {
+    "- **Pipeline**": "pipeline_name",
+    "- **Status**": "status",
+    "- **Started**": "started_at",
+    "- **Prompt**": "prompt",
+}
+
 
 def _iso_now() -> str:
     return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
@@ -22,6 +42,9 @@ def _short_time(iso: str) -> str:
     """Extract HH:MM:SS from an ISO timestamp."""
     if not iso:
         return "—"
+    # Fast path for the exact "%Y-%m-%dT%H:%M:%SZ" shape _iso_now produces
+    if len(iso) == 20 and iso[10] == "T" and iso[19] == "Z":
+        return iso[11:19]
     try:
         dt = datetime.fromisoformat(iso.replace("Z", "+00:00"))
         return dt.strftime("%H:%M:%S")
@@ -29,7 +52,7 @@ def _short_time(iso: str) -> str:
         return iso
 
 
-@dataclass
+@dataclass(slots=True)
 class StageRecord:
     number: int
     name: str
@@ -38,9 +61,11 @@ class StageRecord:
     completed_at: str = ""
     duration_s: float = 0.0
     notes: str = ""
+    # time.monotonic() at stage_start; not rendered, so 0.0 after a reload
+    _started_monotonic: float = field(default=0.0, repr=False, compare=False)
 
 
-@dataclass
+@dataclass(slots=True)
 class PipelineTracker:
     """Track pipeline progress and persist it as Markdown in the book."""
 
@@ -51,8 +76,24 @@ class PipelineTracker:
     stages: list[StageRecord] = field(default_factory=list)
     status: str = "pending"  # pending | running | completed | failed
     started_at: str = ""
+    # The book predates this run, so progress.md may already be in it
+    reused_book: bool = False
+    # stage number -> record; rebuilt by __setattr__ whenever ``stages`` is set
+    _by_number: dict[int, StageRecord] = field(init=False, repr=False, compare=False)
+    # progress.md is known to exist in the book (set after a successful write)
+    _created: bool = field(default=False, init=False, repr=False, compare=False)
+    # Markdown of the last successful write; identical renders are skipped
+    _last_written: str = field(default="", init=False, repr=False, compare=False)
 
-    PROGRESS_PATH: str = "agent-log/progress.md"
+    PROGRESS_PATH: ClassVar[str] = "agent-log/progress.md"
+
+    def __setattr__(self, name: str, value: object) -> None:
+        # Every assignment to ``stages`` (constructor, define_stages, parsing
+        # or a caller) stores a sorted copy and re-indexes it.
+        if name == "stages":
+            value = sorted(value, key=operator.attrgetter("number"))
+            object.__setattr__(self, "_by_number", {s.number: s for s in value})
+        object.__setattr__(self, name, value)
 
     def define_stages(self, stage_defs: list[tuple[int, str]]) -> None:
         """Initialize stage records from (number, name) tuples."""
@@ -70,6 +111,7 @@ class PipelineTracker:
         if rec:
             rec.status = "running"
             rec.started_at = _iso_now()
+            rec._started_monotonic = time.monotonic()
             await self._write()
 
     async def stage_complete(self, stage_number: int, notes: str = "") -> None:
@@ -78,7 +120,9 @@ class PipelineTracker:
         if rec:
             rec.status = "completed"
             rec.completed_at = _iso_now()
-            if rec.started_at:
+            if rec._started_monotonic:
+                rec.duration_s = round(time.monotonic() - rec._started_monotonic, 1)
+            elif rec.started_at:
                 try:
                     t0 = datetime.fromisoformat(rec.started_at.replace("Z", "+00:00"))
                     t1 = datetime.fromisoformat(rec.completed_at.replace("Z", "+00:00"))
@@ -115,20 +159,17 @@ class PipelineTracker:
 
     def next_stage(self) -> int:
         """Return the number of the next pending stage, or -1 if all done."""
-        for s in sorted(self.stages, key=lambda s: s.number):
+        for s in self.stages:
             if s.status in ("pending", "running", "failed"):
                 return s.number
         return -1
 
     def _find(self, stage_number: int) -> StageRecord | None:
-        for s in self.stages:
-            if s.number == stage_number:
-                return s
-        return None
+        return self._by_number.get(stage_number)
 
     def _render_markdown(self) -> str:
         """Render current state as Markdown."""
-        lines = [
+        return "\n".join((
             "# Pipeline Progress",
             "",
             f"- **Pipeline**: {self.pipeline_name}",
@@ -136,48 +177,54 @@ class PipelineTracker:
             f"- **Started**: {self.started_at}",
             f"- **Prompt**: {self.prompt[:200]}",
             "",
-            "## Stages",
-            "",
-            "| # | Stage | Status | Started | Completed | Duration | Notes |",
-            "|---|-------|--------|---------|-----------|----------|-------|",
-        ]
-        for s in sorted(self.stages, key=lambda s: s.number):
-            dur = f"{s.duration_s}s" if s.duration_s else "—"
-            lines.append(
-                f"| {s.number} | {s.name} | {s.status} "
-                f"| {_short_time(s.started_at)} | {_short_time(s.completed_at)} "
-                f"| {dur} | {s.notes} |"
-            )
-        lines.extend([
+            _STAGES_TABLE_HEAD,
+            *map(self._format_row, self.stages),
             "",
             "## Resume Info",
             "",
             f"Last completed stage: {self.last_completed_stage()}",
             f"Next stage to run: {self.next_stage()}",
-        ])
-        return "\n".join(lines)
+        ))
+
+    @staticmethod
+    def _format_row(s: StageRecord) -> str:
+        """Render one stage as a row of the stages table."""
+        dur = f"{s.duration_s}s" if s.duration_s else "—"
+        return (
+            f"| {s.number} | {s.name} | {s.status} "
+            f"| {_short_time(s.started_at)} | {_short_time(s.completed_at)} "
+            f"| {dur} | {s.notes} |"
+        )
 
     async def _write(self) -> None:
         """Write progress Markdown to the book."""
         content = self._render_markdown()
-        try:
-            await self.slima.write_file(
-                self.book_token,
-                path=self.PROGRESS_PATH,
-                content=content,
-                commit_message=f"Update pipeline progress ({self.status})",
-            )
-        except Exception:
-            # First write — file doesn't exist yet, create it
+        if content == self._last_written:
+            return  # e.g. complete() repeated: the book already has this state
+        # Update first once the file is known to exist, or may exist because
+        # the book is reused; create first only in a fresh book. Each call
+        # falls back to the other on failure.
+        if self._created or self.reused_book:
+            calls = ((self.slima.write_file, "Update"), (self.slima.create_file, "Create"))
+        else:
+            calls = ((self.slima.create_file, "Create"), (self.slima.write_file, "Update"))
+        error: Exception | None = None
+        for method, verb in calls:
             try:
-                await self.slima.create_file(
+                await method(
                     self.book_token,
                     path=self.PROGRESS_PATH,
                     content=content,
-                    commit_message=f"Create pipeline progress ({self.status})",
+                    commit_message=f"{verb} pipeline progress ({self.status})",
                 )
             except Exception as e:
-                logger.warning(f"Failed to write pipeline progress: {e}")
+                error = e
+                continue
+            self._created = True
+            self._last_written = content
+            return
+        self._created = False
+        logger.warning(f"Failed to write pipeline progress: {error}")
 
     @classmethod
     async def load_from_book(
@@ -203,50 +250,46 @@ class PipelineTracker:
             slima=slima,
         )
 
-        for line in content.split("\n"):
-            if line.startswith("- **Pipeline**:"):
-                tracker.pipeline_name = line.split(":", 1)[1].strip()
-            elif line.startswith("- **Status**:"):
-                tracker.status = line.split(":", 1)[1].strip()
-            elif line.startswith("- **Started**:"):
-                tracker.started_at = line.split(":", 1)[1].strip()
-            elif line.startswith("- **Prompt**:"):
-                tracker.prompt = line.split(":", 1)[1].strip()
-
-        # Parse stage table rows
+        # One pass: header bullets anywhere, stage rows after the "| # |" header
+        # until the first non-table line.
         stages: list[StageRecord] = []
         in_table = False
         for line in content.split("\n"):
             stripped = line.strip()
+            if not stripped.startswith("|"):
+                in_table = False
+                label, sep, value = line.partition(":")
+                attr = _HEADER_FIELDS.get(label) if sep else None
+                if attr:
+                    setattr(tracker, attr, value.strip())
+                continue
             if stripped.startswith("| # |"):
                 in_table = True
                 continue
-            if stripped.startswith("|---|"):
+            if not in_table or stripped.startswith("|---|"):
                 continue
-            if in_table and stripped.startswith("|"):
-                parts = [p.strip() for p in stripped.split("|")]
-                # parts[0] is empty (before first |), parts[-1] is empty (after last |)
-                parts = [p for p in parts if p != ""]
-                if len(parts) >= 6:
-                    try:
-                        number = int(parts[0])
-                    except (ValueError, IndexError):
-                        continue
-                    rec = StageRecord(
-                        number=number,
-                        name=parts[1],
-                        status=parts[2],
-                        notes=parts[6] if len(parts) > 6 else "",
-                    )
-                    # Parse duration
-                    dur_str = parts[5]
-                    if dur_str != "—":
-                        m = re.match(r"([\d.]+)s", dur_str)
-                        if m:
-                            rec.duration_s = float(m.group(1))
-                    stages.append(rec)
-            elif in_table and not stripped.startswith("|"):
-                in_table = False
+            parts = [p.strip() for p in stripped.split("|")]
+            # parts[0] is empty (before first |), parts[-1] is empty (after last |)
+            parts = [p for p in parts if p != ""]
+            if len(parts) >= 6:
+                try:
+                    number = int(parts[0])
+                except (ValueError, IndexError):
+                    continue
+                rec = StageRecord(
+                    number=number,
+                    name=parts[1],
+                    status=parts[2],
+                    notes=parts[6] if len(parts) > 6 else "",
+                )
+                # Parse duration
+                dur_str = parts[5]
+                if dur_str != "—":
+                    m = _DUR_RE.match(dur_str)
+                    if m:
+                        rec.duration_s = float(m.group(1))
+                stages.append(rec)
 
         tracker.stages = stages
+        tracker._created = True  # it was just read from the book
         return tracker
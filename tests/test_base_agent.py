@@ -7,7 +7,7 @@ from unittest.mock import AsyncMock, patch
 import pytest
 
 from slima_agents.agents.base import BaseAgent, AgentResult
-from slima_agents.agents.claude_runner import RunOutput
+from slima_agents.agents.claude_runner import RunOutput, TokenUsage
 from slima_agents.agents.context import WorldContext
 
 
@@ -117,3 +117,37 @@ async def test_agent_summary_truncated():
         result = await agent.run()
         assert len(result.summary) == 200
         assert result.full_output == long_output
+
+
+@pytest.mark.asyncio
+async def test_agent_reports_token_usage():
+    """Token usage from the result event is carried onto AgentResult."""
+    context = WorldContext()
+    usage = TokenUsage.from_event({
+        "input_tokens": 50,
+        "output_tokens": 400,
+        "cache_creation_input_tokens": 1000,
+        "cache_read_input_tokens": 3000,
+    })
+
+    with patch("slima_agents.agents.base.ClaudeRunner") as MockRunner:
+        MockRunner.run = AsyncMock(
+            return_value=RunOutput(text="Done", num_turns=2, usage=usage)
+        )
+
+        agent = StubAgent(context=context, book_token="bk_test")
+        result = await agent.run()
+
+        assert result.usage.cache_read_input_tokens == 3000
+        assert result.usage.output_tokens == 400
+        assert result.usage.total_input_tokens == 4050
+
+
+def test_token_usage_defaults_and_ratio():
+    """Missing usage block counts as zero; ratio is cache reads over all input."""
+    empty = TokenUsage.from_event(None)
+    assert empty.total_input_tokens == 0
+    assert empty.cache_hit_ratio == 0.0
+
+    usage = TokenUsage(input_tokens=100, cache_read_input_tokens=300)
+    assert usage.cache_hit_ratio == 0.75
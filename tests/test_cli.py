@@ -108,6 +108,13 @@ def test_task_pipeline_help(runner):
     assert result.exit_code == 0
     assert "--model" in result.output
     assert "--json-progress" in result.output
+    assert "--max-parallel" in result.output
+
+
+def test_task_pipeline_max_parallel_must_be_positive(runner):
+    """--max-parallel 0 should be rejected by click."""
+    result = runner.invoke(main, ["task-pipeline", "--max-parallel", "0"], input="{}")
+    assert result.exit_code == 2
 
 
 def test_task_pipeline_in_main_help(runner):
@@ -137,6 +144,16 @@ def test_task_pipeline_invalid_json(runner):
     assert "Plan error:" in result.output
 
 
+def test_task_pipeline_schema_error(runner):
+    """task-pipeline with well-formed JSON that is not a TaskPlan should exit 1."""
+    mock_cfg = _mock_config()
+    with patch("slima_agents.cli.Config.load", return_value=mock_cfg):
+        result = runner.invoke(main, ["task-pipeline"], input='{"stages": []}')
+
+    assert result.exit_code == 1
+    assert "Plan error:" in result.output
+
+
 def test_task_pipeline_stdin_empty(runner):
     """task-pipeline with empty stdin should exit 1."""
     mock_cfg = _mock_config()
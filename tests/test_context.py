@@ -0,0 +1,140 @@
+"""Tests for DynamicContext."""
+
+from __future__ import annotations
+
+import pytest
+
+from slima_agents.agents.context import DynamicContext
+
+
+@pytest.fixture
+def ctx():
+    return DynamicContext(allowed_sections=["overview", "power_structures"])
+
+
+class TestSections:
+    def test_book_structure_always_present(self, ctx):
+        assert ctx.SECTIONS == ("overview", "power_structures", "book_structure")
+
+    def test_no_instance_dict(self, ctx):
+        assert not hasattr(ctx, "__dict__")
+        with pytest.raises(AttributeError):
+            ctx.overview = "x"
+
+    def test_unknown_section_rejected(self, ctx):
+        msg = ctx.write("nope", "x")
+        assert msg.startswith("Unknown section: nope.")
+        assert "overview, power_structures, book_structure" in msg
+
+    def test_unknown_section_message_follows_restored_sections(self, ctx):
+        ctx.from_snapshot({"_allowed_sections": ["items_bestiary"]})
+        assert ctx.read("overview").endswith("Valid: items_bestiary")
+
+
+class TestReadWriteAppend:
+    def test_append_joins_with_newline(self, ctx):
+        ctx.append("overview", "a")
+        ctx.append("overview", "b")
+        ctx.append("overview", "c")
+        assert ctx.read("overview") == "a\nb\nc"
+
+    def test_write_replaces_appended_chunks(self, ctx):
+        ctx.append("overview", "a")
+        ctx.append("overview", "b")
+        ctx.write("overview", "fresh")
+        assert ctx.read("overview") == "fresh"
+
+    def test_append_after_empty_has_no_leading_newline(self, ctx):
+        ctx.write("overview", "")
+        ctx.append("overview", "")
+        ctx.append("overview", "x")
+        assert ctx.read("overview") == "x"
+
+    def test_append_empty_to_existing_keeps_separator(self, ctx):
+        ctx.write("overview", "a")
+        ctx.append("overview", "")
+        ctx.append("overview", "b")
+        assert ctx.read("overview") == "a\n\nb"
+
+    def test_append_empty_to_empty_is_not_a_change(self, ctx):
+        r0 = ctx.revision
+        ctx.append("overview", "")
+        assert ctx.revision == r0
+        assert ctx.read("overview") == ""
+
+
+class TestSerializeForPrompt:
+    def test_empty_placeholder(self, ctx):
+        assert ctx.serialize_for_prompt() == "(No context populated yet.)"
+
+    def test_renders_headers_in_order(self, ctx):
+        ctx.user_prompt = "Build a world"
+        ctx.write("power_structures", "Kings")
+        ctx.write("overview", "A world")
+        assert ctx.serialize_for_prompt() == (
+            "## User Request\nBuild a world\n\n"
+            "## Overview\nA world\n\n"
+            "## Power Structures\nKings"
+        )
+
+    def test_cached_until_mutation(self, ctx):
+        ctx.write("overview", "v1")
+        first = ctx.serialize_for_prompt()
+        assert ctx.serialize_for_prompt() is first
+
+        ctx.append("overview", "v2")
+        assert ctx.serialize_for_prompt() == "## Overview\nv1\nv2"
+
+        ctx.user_prompt = "new request"
+        assert ctx.serialize_for_prompt().startswith("## User Request\nnew request")
+
+    def test_from_snapshot_invalidates_cache(self, ctx):
+        ctx.serialize_for_prompt()
+        ctx.from_snapshot({"overview": "restored"})
+        assert ctx.serialize_for_prompt() == "## Overview\nrestored"
+
+    def test_headers_follow_restored_sections(self, ctx):
+        ctx.from_snapshot({"_allowed_sections": ["items_bestiary"], "items_bestiary": "Dragons"})
+        assert ctx.serialize_for_prompt() == "## Items Bestiary\nDragons"
+
+
+class TestSnapshot:
+    def test_round_trip(self, ctx):
+        ctx.user_prompt = "p"
+        ctx.write("overview", "o")
+        snap = ctx.to_snapshot()
+
+        restored = DynamicContext(allowed_sections=[])
+        restored.from_snapshot(snap)
+        assert restored.SECTIONS == ctx.SECTIONS
+        assert restored.user_prompt == "p"
+        assert restored.read("overview") == "o"
+        assert restored.serialize_for_prompt() == ctx.serialize_for_prompt()
+
+
+class TestRevision:
+    def test_revision_is_monotonic(self, ctx):
+        r0 = ctx.revision
+        ctx.write("overview", "a")
+        r1 = ctx.revision
+        ctx.user_prompt = "p"
+        assert r0 < r1 < ctx.revision
+
+    def test_revision_property_tracks_mutations(self, ctx):
+        r0 = ctx.revision
+        ctx.read("overview")
+        ctx.serialize_for_prompt()
+        assert ctx.revision == r0
+        ctx.append("overview", "a")
+        assert ctx.revision > r0
+
+    def test_identical_write_is_not_a_change(self, ctx):
+        ctx.write("overview", "same")
+        r0 = ctx.revision
+        ctx.write("overview", "same")
+        assert ctx.revision == r0
+
+    def test_from_snapshot_bumps_revision(self, ctx):
+        r0 = ctx.revision
+        ctx.from_snapshot({"overview": "restored"})
+        assert ctx.revision > r0
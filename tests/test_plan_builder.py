@@ -71,6 +71,16 @@ class TestExtractJsonObject:
         result = extract_json_object(raw)
         assert result == {"second": 2}
 
+    def test_brace_inside_string_value(self):
+        raw = 'Plan: {"prompt": "use {book_token} here }"} done'
+        result = extract_json_object(raw)
+        assert result == {"prompt": "use {book_token} here }"}
+
+    def test_skips_non_json_braces(self):
+        raw = 'Set {x} first, then {"title": "Real"}'
+        result = extract_json_object(raw)
+        assert result == {"title": "Real"}
+
     # --- Unicode content ---
 
     def test_unicode_content(self):
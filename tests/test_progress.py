@@ -34,6 +34,10 @@ class TestEmitterDisabled:
         emitter.pipeline_complete("bk_test", 100.0)
         assert buf.getvalue() == ""
 
+    def test_slotted(self):
+        emitter = ProgressEmitter()
+        assert not hasattr(emitter, "__dict__")
+
 
 class TestEmitterOutput:
     def test_writes_valid_ndjson(self):
@@ -87,6 +91,21 @@ class TestEmitterOutput:
         assert ev["summary"] == "World overview generated"
         assert ev["num_turns"] == 5
         assert ev["cost_usd"] == 0.1234
+        assert ev["input_tokens"] == 0
+        assert ev["cache_read_input_tokens"] == 0
+
+    def test_agent_complete_token_usage(self):
+        emitter, buf = _make_emitter()
+        emitter.agent_complete(
+            stage=2, agent="TaskAgent[write]", duration_s=5.0,
+            input_tokens=120, output_tokens=800,
+            cache_creation_input_tokens=3000, cache_read_input_tokens=9000,
+        )
+        ev = _parse_events(buf)[0]
+        assert ev["input_tokens"] == 120
+        assert ev["output_tokens"] == 800
+        assert ev["cache_creation_input_tokens"] == 3000
+        assert ev["cache_read_input_tokens"] == 9000
 
     def test_summary_truncated_at_200(self):
         emitter, buf = _make_emitter()
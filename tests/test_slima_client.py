@@ -6,7 +6,7 @@ import pytest
 import httpx
 import respx
 
-from slima_agents.slima.client import SlimaClient, AuthenticationError, NotFoundError
+from slima_agents.slima.client import SlimaClient, AuthenticationError, NotFoundError, SlimaApiError
 
 
 BASE_URL = "https://test.slima.app"
@@ -134,6 +134,34 @@ async def test_not_found_error(client: SlimaClient):
         await client.get_book("bk_missing")
 
 
+@respx.mock
+@pytest.mark.asyncio
+async def test_other_error_status(client: SlimaClient):
+    respx.get(f"{BASE_URL}/api/v1/books").mock(
+        return_value=httpx.Response(422, json={
+            "error": {"code": "invalid", "message": "Bad request"}
+        })
+    )
+
+    with pytest.raises(SlimaApiError) as exc_info:
+        await client.list_books()
+    assert type(exc_info.value) is SlimaApiError
+    assert exc_info.value.status == 422
+    assert exc_info.value.code == "invalid"
+    assert str(exc_info.value) == "Bad request"
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_error_without_json_body(client: SlimaClient):
+    respx.get(f"{BASE_URL}/api/v1/books").mock(
+        return_value=httpx.Response(401, text="nope")
+    )
+
+    with pytest.raises(AuthenticationError, match="Authentication failed"):
+        await client.list_books()
+
+
 @respx.mock
 @pytest.mark.asyncio
 async def test_search_files(client: SlimaClient):
@@ -161,3 +189,50 @@ async def test_search_files(client: SlimaClient):
     resp = await client.search_files("bk_1", "hello")
     assert len(resp.matches) == 1
     assert resp.query == "hello"
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_get_book_structure(client: SlimaClient):
+    respx.get(f"{BASE_URL}/api/v1/books/bk_1/commits?limit=1").mock(
+        return_value=httpx.Response(200, json={
+            "data": {
+                "commits": [
+                    {
+                        "token": "cm_1",
+                        "name": "Latest",
+                        "commitType": "manual",
+                        "fileCount": 2,
+                        "totalWordCount": 10,
+                        "manuscriptWordCount": 10,
+                        "createdAt": "2024-01-01T00:00:00Z",
+                        "filesSnapshot": [
+                            {"token": "f_dir", "name": "chapters", "kind": "file", "position": 0},
+                            {"token": "f_1", "name": "ch1.md", "kind": "file", "position": 0,
+                             "parentToken": "f_dir"},
+                            {"token": "f_2", "name": "notes.md", "kind": "file", "position": 1,
+                             "parentToken": "f_gone"},
+                        ],
+                    }
+                ]
+            }
+        })
+    )
+
+    structure = await client.get_book_structure("bk_1")
+    assert structure == [
+        {"name": "chapters", "kind": "folder", "position": 0, "children": [
+            {"name": "ch1.md", "kind": "file", "position": 0},
+        ]},
+        {"name": "notes.md", "kind": "file", "position": 1},
+    ]
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_get_book_structure_no_commits(client: SlimaClient):
+    respx.get(f"{BASE_URL}/api/v1/books/bk_1/commits?limit=1").mock(
+        return_value=httpx.Response(200, json={"data": {"commits": []}})
+    )
+
+    assert await client.get_book_structure("bk_1") == []
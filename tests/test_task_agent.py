@@ -6,6 +6,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from slima_agents.agents.claude_runner import TokenUsage
 from slima_agents.agents.context import WorldContext
 from slima_agents.agents.task import (
     TaskAgent,
@@ -39,6 +40,7 @@ def _make_run_output(text: str = "done", **overrides):
     out.num_turns = overrides.get("num_turns", 1)
     out.cost_usd = overrides.get("cost_usd", 0.01)
     out.session_id = overrides.get("session_id", "sess_task_1")
+    out.usage = TokenUsage()
     return out
 
 
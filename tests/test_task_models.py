@@ -74,6 +74,10 @@ class TestTaskPlan:
         with pytest.raises(Exception):
             TaskPlan(stages=[])
 
+    def test_schema_requires_a_stage(self):
+        schema = TaskPlan.model_json_schema()
+        assert schema["properties"]["stages"]["minItems"] == 1
+
     def test_context_sections_derived(self):
         plan = TaskPlan(stages=[
             TaskStageDefinition(number=1, name="a", prompt="x", context_section="overview"),
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -108,6 +109,8 @@ class TestBookSetup:
 
         mock_slima.create_book.assert_not_awaited()
         assert book_token == "bk_existing"
+        # progress.md may already exist in a reused book: update, never create
+        mock_slima.create_file.assert_not_awaited()
 
     @pytest.mark.asyncio
     async def test_no_book_mode(self, mock_slima, emitter):
@@ -244,6 +247,68 @@ class TestParallelExecution:
         # 4 stages total: 1 sequential + 2 parallel + 1 sequential
         assert run_count == 4
 
+    @pytest.mark.asyncio
+    async def test_max_parallel_caps_concurrency(self, mock_slima, emitter):
+        """No more than max_parallel agents of a group should run at once."""
+        plan = TaskPlan(
+            stages=[TaskStageDefinition(number=1, name=f"s{i}", prompt="p") for i in range(5)],
+        )
+
+        running = 0
+        peak = 0
+
+        async def _run_side():
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return _result()
+
+        with patch("slima_agents.agents.task_orchestrator.TaskAgent") as MockAgent:
+            instance = AsyncMock()
+            instance.run = AsyncMock(side_effect=_run_side)
+            instance.name = "TaskAgent"
+            MockAgent.return_value = instance
+
+            orch = TaskOrchestrator(mock_slima, model="test", emitter=emitter, max_parallel=2)
+            await orch.run(plan)
+
+        assert instance.run.await_count == 5
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_capped_group_shares_one_context(self, mock_slima, emitter):
+        """Queued stages must not see handoffs from siblings that ran first."""
+        plan = TaskPlan(
+            stages=[
+                TaskStageDefinition(number=1, name=f"s{i}", prompt="p", context_section=f"sec{i}")
+                for i in range(3)
+            ],
+        )
+        seen: list[str] = []
+
+        def _make_agent(**kwargs):
+            agent = AsyncMock()
+            agent.name = "TaskAgent"
+
+            async def _run():
+                seen.append(kwargs["context"].serialize_for_prompt())
+                return _result("out", "full output")
+
+            agent.run = AsyncMock(side_effect=_run)
+            return agent
+
+        with patch("slima_agents.agents.task_orchestrator.TaskAgent", side_effect=_make_agent):
+            orch = TaskOrchestrator(mock_slima, model="test", emitter=emitter, max_parallel=1)
+            await orch.run(plan)
+
+        assert len(seen) == 3
+        assert seen[0] == seen[1] == seen[2]
+        assert "full output" not in seen[0]
+        # Every handoff still reaches the shared context for later groups
+        assert all(orch.context.read(f"sec{i}") for i in range(3))
+
 
 # ---------------------------------------------------------------------------
 # Context accumulation
@@ -271,7 +336,7 @@ class TestContextAccumulation:
             await orch.run(plan)
 
         # Context should have overview populated with structured handoff
-        overview = await orch.context.read("overview")
+        overview = orch.context.read("overview")
         assert "Stage 1 full output" in overview
         assert "[Stage 1" in overview  # handoff header
 
@@ -302,10 +367,10 @@ class TestContextAccumulation:
             orch = TaskOrchestrator(mock_slima, model="test-model", emitter=emitter)
             await orch.run(plan)
 
-        overview = await orch.context.read("overview")
+        overview = orch.context.read("overview")
         assert "full-output-1" in overview
         assert "[Stage 1" in overview  # handoff header
-        detail = await orch.context.read("detail")
+        detail = orch.context.read("detail")
         assert "full-output-2" in detail
         assert "[Stage 2" in detail  # handoff header
 
@@ -454,6 +519,30 @@ class TestBookStructureInjection:
 
         # get_book_structure called for injection + file path snapshots
         assert mock_slima.get_book_structure.await_count >= 2
+        assert "task-plan.json" in orch.context.read("book_structure")
+
+    @pytest.mark.asyncio
+    async def test_injection_reuses_post_stage_fetch(self, mock_slima, emitter):
+        """Each group fetches the structure before and after, not a third time."""
+        plan = TaskPlan(
+            title="Fetch Count",
+            stages=[
+                TaskStageDefinition(number=1, name="s1", prompt="p"),
+                TaskStageDefinition(number=2, name="a", prompt="p"),
+                TaskStageDefinition(number=2, name="b", prompt="p"),
+            ],
+        )
+
+        with patch("slima_agents.agents.task_orchestrator.TaskAgent") as MockAgent:
+            instance = AsyncMock()
+            instance.run = AsyncMock(return_value=_result())
+            instance.name = "TaskAgent"
+            MockAgent.return_value = instance
+
+            orch = TaskOrchestrator(mock_slima, model="test", emitter=emitter)
+            await orch.run(plan)
+
+        assert mock_slima.get_book_structure.await_count == 4  # 2 groups x (pre + post)
 
 
 # ---------------------------------------------------------------------------
@@ -469,7 +558,7 @@ class TestContextSnapshot:
             title="Snapshot Test",
             stages=[
                 TaskStageDefinition(number=1, name="s1", prompt="p", context_section="overview"),
-                TaskStageDefinition(number=2, name="s2", prompt="p"),
+                TaskStageDefinition(number=2, name="s2", prompt="p", context_section="notes"),
             ],
         )
 
@@ -482,13 +571,27 @@ class TestContextSnapshot:
             orch = TaskOrchestrator(mock_slima, model="test", emitter=emitter)
             await orch.run(plan)
 
-        # write_file called for context snapshot (once per group with book)
+        # write_file called for context snapshot (once per group that changed it)
         snapshot_calls = [
             c for c in mock_slima.write_file.call_args_list
             if "context-snapshot.json" in str(c)
         ]
         assert len(snapshot_calls) == 2  # 2 groups
 
+    @pytest.mark.asyncio
+    async def test_snapshot_skipped_when_context_unchanged(self, mock_slima, emitter):
+        orch = TaskOrchestrator(mock_slima, model="test", emitter=emitter)
+        orch.context = DynamicContext(allowed_sections=["overview"])
+        orch.context.write("overview", "o")
+
+        await orch._save_context_snapshot("bk_1")
+        await orch._save_context_snapshot("bk_1")
+        assert mock_slima.write_file.await_count == 1
+
+        orch.context.append("overview", "more")
+        await orch._save_context_snapshot("bk_1")
+        assert mock_slima.write_file.await_count == 2
+
 
 # ---------------------------------------------------------------------------
 # Error handling
@@ -627,6 +730,15 @@ class TestGroupStages:
         assert len(groups) == 1
         assert len(groups[1]) == 3
 
+    def test_groups_in_number_order(self):
+        stages = [
+            TaskStageDefinition(number=3, name="c", prompt="x"),
+            TaskStageDefinition(number=1, name="a", prompt="x"),
+            TaskStageDefinition(number=2, name="b", prompt="x"),
+        ]
+        groups = TaskOrchestrator._group_stages(stages)
+        assert list(groups) == [1, 2, 3]
+
 
 # ---------------------------------------------------------------------------
 # Pipeline metadata injection
@@ -654,7 +766,7 @@ class TestPipelineMetadata:
             orch = TaskOrchestrator(mock_slima, model="test", emitter=emitter)
             await orch.run(plan)
 
-        info = await orch.context.read("_pipeline_info")
+        info = orch.context.read("_pipeline_info")
         assert "My Book" in info
         assert "bk_task_test" in info
         assert "Research" in info
@@ -677,9 +789,32 @@ class TestPipelineMetadata:
             orch = TaskOrchestrator(mock_slima, model="test", emitter=emitter)
             await orch.run(plan)
 
-        info = await orch.context.read("_pipeline_info")
+        info = orch.context.read("_pipeline_info")
         assert "(no book)" in info
 
+    @pytest.mark.asyncio
+    async def test_pipeline_info_lists_stages_in_order(self, mock_slima, emitter):
+        """Stage plan should be ordered by number even if the plan is not."""
+        plan = TaskPlan(
+            stages=[
+                TaskStageDefinition(number=2, name="b", prompt="p"),
+                TaskStageDefinition(number=1, name="a", prompt="p"),
+                TaskStageDefinition(number=2, name="c", prompt="p"),
+            ],
+        )
+
+        with patch("slima_agents.agents.task_orchestrator.TaskAgent") as MockAgent:
+            instance = AsyncMock()
+            instance.run = AsyncMock(return_value=_result())
+            instance.name = "TaskAgent"
+            MockAgent.return_value = instance
+
+            orch = TaskOrchestrator(mock_slima, model="test", emitter=emitter)
+            await orch.run(plan)
+
+        info = orch.context.read("_pipeline_info")
+        assert info.endswith("  1. a (a)\n  2. b (b)\n  2. c (c)")
+
 
 # ---------------------------------------------------------------------------
 # Structured handoff
@@ -706,7 +841,7 @@ class TestStructuredHandoff:
             orch = TaskOrchestrator(mock_slima, model="test", emitter=emitter)
             await orch.run(plan)
 
-        overview = await orch.context.read("overview")
+        overview = orch.context.read("overview")
         assert "[Stage 1 'Research' completed]" in overview
         assert "---" in overview
         assert "Full research output" in overview
@@ -747,7 +882,7 @@ class TestStructuredHandoff:
             orch = TaskOrchestrator(mock_slima, model="test", emitter=emitter)
             await orch.run(plan)
 
-        output = await orch.context.read("output")
+        output = orch.context.read("output")
         assert "chapters/ch01.md" in output
 
     def test_build_handoff_static(self):
@@ -4,10 +4,12 @@ from __future__ import annotations
 
 from unittest.mock import AsyncMock, MagicMock
 
+import httpx
 import pytest
+import respx
 
 from slima_agents.slima.client import SlimaClient
-from slima_agents.tracker import PipelineTracker, StageRecord
+from slima_agents.tracker import PipelineTracker, StageRecord, _short_time
 
 
 @pytest.fixture
@@ -42,10 +44,64 @@ class TestDefineStages:
         assert tracker.stages[0].name == "research"
         assert tracker.stages[0].status == "pending"
 
+    def test_slotted(self, tracker):
+        assert not hasattr(tracker, "__dict__")
+        assert not hasattr(tracker.stages[0], "__dict__")
+        assert PipelineTracker.PROGRESS_PATH == "agent-log/progress.md"
+
     def test_all_pending(self, tracker):
         for s in tracker.stages:
             assert s.status == "pending"
 
+    def test_stages_kept_in_number_order(self, tracker):
+        tracker.define_stages([(3, "validation"), (1, "research"), (2, "writing")])
+        assert [s.number for s in tracker.stages] == [1, 2, 3]
+        assert tracker.next_stage() == 1
+
+    @pytest.mark.asyncio
+    async def test_stages_passed_to_constructor(self, mock_slima):
+        t = PipelineTracker(
+            pipeline_name="test",
+            book_token="bk_test",
+            prompt="p",
+            slima=mock_slima,
+            stages=[StageRecord(number=2, name="b"), StageRecord(number=1, name="a")],
+        )
+        assert [s.number for s in t.stages] == [1, 2]
+        await t.stage_start(1)
+        assert t.stages[0].status == "running"
+
+    def test_reassigned_stages_are_reindexed(self, tracker):
+        new = [StageRecord(number=5, name="e"), StageRecord(number=4, name="d")]
+        tracker.stages = new
+        assert [s.number for s in tracker.stages] == [4, 5]
+        assert tracker._find(5) is new[0]
+        assert tracker._find(1) is None
+        # The caller's list is not reordered in place
+        assert [s.number for s in new] == [5, 4]
+
+    def test_private_state_not_in_init_or_repr(self, mock_slima):
+        with pytest.raises(TypeError):
+            PipelineTracker(
+                pipeline_name="t", book_token="bk", prompt="p", slima=mock_slima,
+                _by_number={},
+            )
+        assert "_by_number" not in repr(
+            PipelineTracker(pipeline_name="t", book_token="bk", prompt="p", slima=mock_slima)
+        )
+
+
+class TestShortTime:
+    def test_iso_now_format(self):
+        assert _short_time("2026-02-27T10:05:09Z") == "10:05:09"
+
+    def test_offset_format(self):
+        assert _short_time("2026-02-27T10:05:09+00:00") == "10:05:09"
+
+    def test_empty_and_unparseable(self):
+        assert _short_time("") == "—"
+        assert _short_time("soon") == "soon"
+
 
 class TestStageLifecycle:
     @pytest.mark.asyncio
@@ -65,6 +121,14 @@ class TestStageLifecycle:
         assert rec.notes == "Done well"
         assert rec.duration_s >= 0
 
+    @pytest.mark.asyncio
+    async def test_duration_uses_monotonic_clock(self, tracker):
+        await tracker.stage_start(1)
+        rec = tracker._find(1)
+        rec._started_monotonic -= 2.5
+        await tracker.stage_complete(1)
+        assert rec.duration_s == pytest.approx(2.5, abs=0.1)
+
     @pytest.mark.asyncio
     async def test_stage_failed(self, tracker):
         await tracker.stage_start(1)
@@ -121,6 +185,17 @@ class TestMarkdownRendering:
         assert "writing" in md
         assert "validation" in md
 
+    def test_render_stage_row(self, tracker):
+        rec = tracker._find(2)
+        rec.status = "completed"
+        rec.started_at = "2026-02-27T10:00:00Z"
+        rec.completed_at = "2026-02-27T10:02:00Z"
+        rec.duration_s = 120.0
+        rec.notes = "ok"
+        md = tracker._render_markdown()
+        assert "\n| 2 | writing | completed | 10:00:00 | 10:02:00 | 120.0s | ok |\n" in md
+        assert "| 3 | validation | pending | — | — | — |  |\n\n## Resume Info" in md
+
     def test_render_contains_resume_info(self, tracker):
         md = tracker._render_markdown()
         assert "Last completed stage: 0" in md
@@ -158,6 +233,23 @@ class TestMarkdownRoundTrip:
         assert parsed.stages[1].status == "running"
         assert parsed.last_completed_stage() == 1
         assert parsed.next_stage() == 2
+        assert parsed._find(2) is parsed.stages[1]
+
+    def test_rows_after_table_ends_are_ignored(self, mock_slima):
+        md = (
+            "- **Pipeline**: task\n"
+            "| # | Stage | Status | Started | Completed | Duration | Notes |\n"
+            "|---|-------|--------|---------|-----------|----------|-------|\n"
+            "| 1 | plan | completed | — | — | 3s | |\n"
+            "\n"
+            "| 9 | stray | pending | — | — | — | |\n"
+            "- **Status**: completed\n"
+        )
+        parsed = PipelineTracker._parse_markdown(md, mock_slima, "bk_abc")
+        assert [s.number for s in parsed.stages] == [1]
+        assert parsed.stages[0].duration_s == 3.0
+        assert parsed.pipeline_name == "task"
+        assert parsed.status == "completed"
 
 
 class TestPipelineLifecycle:
@@ -169,6 +261,72 @@ class TestPipelineLifecycle:
         # Should attempt to write
         assert mock_slima.write_file.called or mock_slima.create_file.called
 
+    @pytest.mark.asyncio
+    async def test_creates_once_then_updates(self, tracker, mock_slima):
+        await tracker.start()
+        await tracker.stage_start(1)
+        assert mock_slima.create_file.await_count == 1
+        assert mock_slima.write_file.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_existing_file_falls_back_to_update(self, tracker, mock_slima):
+        mock_slima.create_file.side_effect = Exception("exists")
+        await tracker.start()
+        await tracker.stage_start(1)
+        assert mock_slima.create_file.await_count == 1
+        assert mock_slima.write_file.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_reused_book_updates_first(self, tracker, mock_slima):
+        tracker.reused_book = True
+        await tracker.start()
+        mock_slima.create_file.assert_not_awaited()
+        assert mock_slima.write_file.await_count == 1
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_create_rejected_as_existing_falls_back_to_update(self):
+        base = "https://test.slima.app"
+        create = respx.post(f"{base}/api/v1/books/bk_test/mcp/files/create").mock(
+            return_value=httpx.Response(422, json={
+                "error": {"code": "file_exists", "message": "File already exists"}
+            })
+        )
+        update = respx.post(f"{base}/api/v1/books/bk_test/mcp/files/update").mock(
+            return_value=httpx.Response(200, json={"data": {"commit": {
+                "token": "cm_1",
+                "name": "commit-1",
+                "commitType": "auto",
+                "fileCount": 1,
+                "totalWordCount": 0,
+                "manuscriptWordCount": 0,
+                "createdAt": "2024-01-01T00:00:00Z",
+                "filesSnapshot": [],
+            }}})
+        )
+        async with SlimaClient(base, "tok") as slima:
+            t = PipelineTracker(pipeline_name="test", book_token="bk_test", prompt="p", slima=slima)
+            await t.start()
+            await t.complete()
+        assert create.call_count == 1
+        assert update.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_unchanged_state_not_rewritten(self, tracker, mock_slima):
+        await tracker.start()
+        await tracker.complete()
+        await tracker.complete()
+        assert mock_slima.create_file.await_count + mock_slima.write_file.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_write_is_retried(self, tracker, mock_slima):
+        mock_slima.create_file.side_effect = Exception("down")
+        mock_slima.write_file.side_effect = Exception("down")
+        await tracker.start()
+        mock_slima.create_file.side_effect = None
+        await tracker.start()
+        assert mock_slima.create_file.await_count == 2
+
     @pytest.mark.asyncio
     async def test_complete(self, tracker):
         await tracker.start()